@@ -0,0 +1,70 @@
+"""
+Persistent response cache for the FineData API client.
+
+Stores msgspec-encodable values as msgpack files under a cache directory,
+one file per key, so repeated runs can reuse earlier results.
+"""
+
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional, TypeVar
+
+import msgspec
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class DiskCache:
+    """
+    On-disk cache keyed by hex digests.
+
+    Entries live at {directory}/{key[:2]}/{key}.msgpack and are considered
+    fresh for `ttl` seconds after they were last written.
+    """
+
+    def __init__(self, directory: str, ttl: float):
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.msgpack"
+
+    def load(self, key: str, type: type[T]) -> Optional[tuple[T, bool]]:
+        """Return (value, is_fresh) for key, including expired entries."""
+        path = self._path(key)
+        try:
+            fresh = time.time() - path.stat().st_mtime < self.ttl
+            return msgspec.msgpack.decode(path.read_bytes(), type=type), fresh
+        except FileNotFoundError:
+            return None
+        except (OSError, msgspec.DecodeError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def touch(self, key: str):
+        """Mark the entry for key as freshly validated."""
+        try:
+            os.utime(self._path(key))
+        except OSError as e:
+            logger.warning(f"Failed to refresh cache entry {key}: {e}")
+
+    def set(self, key: str, value: object):
+        """Store value under key, replacing any existing entry atomically."""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(msgspec.msgpack.encode(value))
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {path}: {e}")
@@ -4,17 +4,72 @@ HTTP Client for FineData API.
 Provides async methods for all FineData scraping endpoints.
 """
 
+import asyncio
+import gzip
+import hashlib
 import httpx
 import logging
-from typing import Any, Optional
-from dataclasses import dataclass, field
+import msgspec
+import operator
+import orjson
+import os
+import random
+import time
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Awaitable, Callable, Mapping, Optional
+from dataclasses import dataclass, field, fields, replace
 
+from .cache import DiskCache
 from .config import get_config
+from .reliability import CircuitBreaker, CircuitOpenError, CircuitState
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on cached results kept in memory (oldest are evicted first)
+CACHE_MAX_ENTRIES = 256
 
-@dataclass
+# Seconds a get_usage response is reused
+USAGE_CACHE_TTL = 10.0
+
+# Job statuses after which a job no longer changes
+TERMINAL_JOB_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+# Request bodies larger than this are gzip-compressed when enabled
+# (FINEDATA_GZIP_REQUESTS; batch payloads only)
+GZIP_MIN_BYTES = 4096
+
+# Client-side retries for transient API failures. These are separate from
+# ScrapeOptions.max_retries, which the API applies to the target site.
+RETRY_ATTEMPTS = 3
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+RETRY_BACKOFF_BASE = 0.25
+RETRY_BACKOFF_CAP = 8.0
+RETRY_AFTER_MAX = 30.0
+
+# Only errors raised before the request reached the API are retried;
+# retrying after a read timeout could run (and bill) a scrape twice.
+RETRY_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# Seconds allowed to establish a connection to the API
+CONNECT_TIMEOUT = 10.0
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """
+    Return the Retry-After delay if given (capped at RETRY_AFTER_MAX),
+    else full-jitter exponential backoff.
+    """
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(RETRY_AFTER_MAX, max(0.0, float(retry_after)))
+            except ValueError:
+                pass  # HTTP-date form, fall back to backoff
+    return random.uniform(0, min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2 ** attempt))
+
+
+@dataclass(frozen=True, slots=True)
 class ScrapeOptions:
     """Options for scraping requests."""
     
@@ -45,47 +100,62 @@ class ScrapeOptions:
     session_id: Optional[str] = None
     session_ttl: int = 1800
     
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to API request dict."""
-        return {
-            "method": self.method,
-            "headers": self.headers,
-            "body": self.body,
-            "tls_profile": self.tls_profile,
-            "max_retries": self.max_retries,
-            "timeout": self.timeout,
-            "use_antibot": self.use_antibot,
-            "use_js_render": self.use_js_render,
-            "use_residential": self.use_residential,
-            "use_mobile": self.use_mobile,
-            "use_undetected": self.use_undetected,
-            "use_nodriver": self.use_nodriver,
-            "js_wait_for": self.js_wait_for,
-            "js_scroll": self.js_scroll,
-            "solve_captcha": self.solve_captcha,
-            "session_id": self.session_id,
-            "session_ttl": self.session_ttl,
-        }
-
-
-@dataclass
-class ScrapeResult:
+    # API payload and its JSON encoding, built once in __post_init__
+    # (options are immutable)
+    _payload: dict[str, Any] = field(init=False, repr=False, compare=False)
+    _json_fields: bytes = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        payload = dict(zip(_OPTION_FIELDS, _get_option_values(self)))
+        object.__setattr__(self, "_payload", payload)
+        # Encoded fields without the enclosing braces, ready for splicing
+        object.__setattr__(self, "_json_fields", orjson.dumps(payload)[1:-1])
+    
+    def to_dict(self) -> Mapping[str, Any]:
+        """Return the API request fields as a read-only mapping."""
+        return MappingProxyType(self._payload)
+    
+    def to_json(self, url: str, **extra: Any) -> bytes:
+        """
+        Encode the API request body for url as JSON.
+        
+        The options are encoded once per instance; only url and any extra
+        fields are serialized per call.
+        """
+        body = b'{"url":' + orjson.dumps(url) + b"," + self._json_fields
+        if extra:
+            body += b"," + orjson.dumps(extra)[1:-1]
+        return body + b"}"
+
+
+# API request fields of ScrapeOptions, in payload order
+_OPTION_FIELDS = tuple(f.name for f in fields(ScrapeOptions) if f.init)
+_get_option_values = operator.attrgetter(*_OPTION_FIELDS)
+
+
+class ScrapeResult(msgspec.Struct, kw_only=True, frozen=True):
     """Result from a scrape request."""
     
-    success: bool
-    status_code: int
-    headers: dict[str, Any]
-    body: str
-    meta: dict[str, Any]
-    tokens_used: int
+    success: bool = False
+    status_code: int = 0
+    headers: dict[str, Any] = {}
+    body: str = ""
+    meta: dict[str, Any] = {}
+    tokens_used: int | float = 0
     captcha_detected: bool = False
     captcha_type: Optional[str] = None
     captcha_solved: bool = False
     error: Optional[str] = None
+    
+    # Cache validators of the scraped page, from its response headers
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    
+    # Whether the result was served from the persistent cache
+    from_cache: bool = False
 
 
-@dataclass
-class AsyncJob:
+class AsyncJob(msgspec.Struct, kw_only=True, frozen=True):
     """Async job response."""
     
     job_id: str
@@ -97,46 +167,325 @@ class AsyncJob:
     error: Optional[str] = None
 
 
+class _ScrapeEnvelope(msgspec.Struct, kw_only=True):
+    """Scrape result as sent by the API, where any field may be null."""
+    
+    success: Optional[bool] = None
+    status_code: Optional[int] = None
+    headers: Optional[dict[str, Any]] = None
+    body: Optional[str] = None
+    meta: Optional[dict[str, Any]] = None
+    tokens_used: Optional[int | float] = None
+    captcha_detected: Optional[bool] = None
+    captcha_type: Optional[str] = None
+    captcha_solved: Optional[bool] = None
+    error: Optional[str] = None
+
+
+class _JobEnvelope(msgspec.Struct, kw_only=True):
+    """Job as sent by the API; tokens are reported on the job, not the result."""
+    
+    job_id: str
+    status: str
+    url: str
+    created_at: str
+    estimated_completion: Optional[str] = None
+    result: Optional[_ScrapeEnvelope] = None
+    error: Optional[str] = None
+    tokens_used: Optional[int | float] = None
+
+
+def _page_validators(headers: dict[str, Any]) -> tuple[Optional[str], Optional[str]]:
+    """Return the (ETag, Last-Modified) values from page headers, if any."""
+    etag = last_modified = None
+    for name, value in headers.items():
+        lower = name.lower()
+        if lower == "etag":
+            etag = value
+        elif lower == "last-modified":
+            last_modified = value
+    return etag, last_modified
+
+
+def _to_scrape_result(
+    envelope: _ScrapeEnvelope,
+    status_code: int = 0,
+    tokens_used: Optional[int | float] = None,
+) -> ScrapeResult:
+    """Build a ScrapeResult, replacing null API fields with defaults."""
+    headers = envelope.headers or {}
+    etag, last_modified = _page_validators(headers)
+    if tokens_used is None:
+        tokens_used = envelope.tokens_used
+    return ScrapeResult(
+        success=bool(envelope.success),
+        status_code=envelope.status_code or status_code,
+        headers=headers,
+        body=envelope.body or "",
+        meta=envelope.meta or {},
+        tokens_used=tokens_used or 0,
+        captcha_detected=bool(envelope.captcha_detected),
+        captcha_type=envelope.captcha_type,
+        captcha_solved=bool(envelope.captcha_solved),
+        error=envelope.error,
+        etag=etag,
+        last_modified=last_modified,
+    )
+
+
+def _to_async_job(envelope: _JobEnvelope) -> AsyncJob:
+    """Build an AsyncJob; the result carries the job-level token count."""
+    result = None
+    if envelope.result is not None:
+        result = _to_scrape_result(envelope.result, tokens_used=envelope.tokens_used or 0)
+    return AsyncJob(
+        job_id=envelope.job_id,
+        status=envelope.status,
+        url=envelope.url,
+        created_at=envelope.created_at,
+        estimated_completion=envelope.estimated_completion,
+        result=result,
+        error=envelope.error,
+    )
+
+
+# Decoders are built once and reused for every response. Non-strict mode
+# accepts numbers and booleans sent as strings.
+_scrape_decoder = msgspec.json.Decoder(_ScrapeEnvelope, strict=False)
+_job_decoder = msgspec.json.Decoder(_JobEnvelope, strict=False)
+
+
+@dataclass(slots=True)
+class _Flight:
+    """A shared in-flight fetch and the number of callers awaiting it."""
+    
+    task: asyncio.Future
+    waiters: int = 0
+
+
 class FineDataClient:
     """Async HTTP client for FineData API."""
     
-    def __init__(self):
+    def __init__(self, api_key: Optional[str] = None):
         config = get_config()
         self.api_url = config.api_url.rstrip("/")
-        self.api_key = config.api_key
+        self.api_key = api_key or config.api_key
         self.timeout = config.timeout
+        self.gzip_requests = config.gzip_requests
         self._client: Optional[httpx.AsyncClient] = None
+        self._client_lock = asyncio.Lock()
+        
+        # Bulkhead bounding simultaneous requests to the API
+        self._bulkhead = asyncio.Semaphore(config.max_concurrency)
+        
+        # Circuit breakers keyed by endpoint path
+        self._breakers: dict[str, CircuitBreaker] = {}
+        
+        # Single-flight + TTL cache for idempotent requests
+        self.cache_ttl = config.cache_ttl
+        self._inflight: dict[str, _Flight] = {}
+        self._cache: dict[str, tuple[float, Any]] = {}
+        
+        # Short-lived usage cache; the lock collapses concurrent refreshes
+        self._usage_cache: tuple[float, dict[str, Any]] | None = None
+        self._usage_lock = asyncio.Lock()
+        
+        # Optional persistent cache of successful scrapes, namespaced by API
+        # key so one account is never served pages scraped (and billed) by another
+        self._disk_cache: Optional[DiskCache] = None
+        if config.cache_dir:
+            namespace = hashlib.blake2b(self.api_key.encode(), digest_size=8).hexdigest()
+            self._disk_cache = DiskCache(
+                os.path.join(config.cache_dir, namespace),
+                config.cache_ttl_hours * 3600,
+            )
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.timeout + 30),
-                headers={
-                    "x-api-key": self.api_key,
-                    "Content-Type": "application/json",
-                    "User-Agent": "finedata-mcp/0.1.0",
-                },
-            )
+        """Get or create HTTP client.
+        
+        A single HTTP/2 client is shared by all calls so the connection
+        to the API is multiplexed and reused for the process lifetime.
+        """
+        if self._client is not None and not self._client.is_closed:
+            return self._client
+        
+        async with self._client_lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.AsyncClient(
+                    http2=True,
+                    timeout=httpx.Timeout(self.timeout + 30, connect=CONNECT_TIMEOUT),
+                    limits=httpx.Limits(
+                        max_connections=200,
+                        max_keepalive_connections=100,
+                        keepalive_expiry=60.0,
+                    ),
+                    headers={
+                        "x-api-key": self.api_key,
+                        "Content-Type": "application/json",
+                        "Accept-Encoding": "gzip, br",
+                        "User-Agent": "finedata-mcp/0.1.0",
+                    },
+                )
         return self._client
     
+    async def warmup(self):
+        """
+        Open the connection to the API ahead of the first tool call.
+        
+        Sends a HEAD request so TCP, TLS and HTTP/2 setup happen at startup;
+        the response and any errors are ignored.
+        """
+        client = await self._get_client()
+        try:
+            await client.head(f"{self.api_url}/api/v1/usage", timeout=10)
+        except httpx.HTTPError as e:
+            logger.warning(f"Connection warmup failed: {e}")
+    
     async def close(self):
         """Close the HTTP client."""
         if self._client and not self._client.is_closed:
             await self._client.aclose()
             self._client = None
     
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        suffix: str = "",
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a request to an API endpoint through the shared client.
+        
+        Requests are bounded by the bulkhead and guarded by the endpoint's
+        circuit breaker: 5xx responses and any error raised while sending
+        count as failures, and CircuitOpenError is raised while the circuit
+        is open.
+        
+        Args:
+            method: HTTP method
+            endpoint: Endpoint path, also used as the circuit breaker key
+            suffix: Path appended to the endpoint (e.g. a job ID)
+        """
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._breakers[endpoint] = CircuitBreaker()
+        breaker.before_call()
+        
+        try:
+            client = await self._get_client()
+            async with self._bulkhead:
+                response = await client.request(
+                    method, f"{self.api_url}{endpoint}{suffix}", **kwargs
+                )
+        except asyncio.CancelledError:
+            # Don't leave a half-open circuit waiting on a trial that never ends
+            if breaker.state is CircuitState.HALF_OPEN:
+                breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.record_failure()
+            raise
+        
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+    
+    async def _coalesce(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool],
+    ) -> Any:
+        """
+        Run fetch at most once per key across concurrent callers.
+        
+        Callers arriving while a fetch for the same key is in flight await
+        its result instead of issuing another request. Results accepted by
+        cacheable are then reused for cache_ttl seconds. If every caller
+        waiting on a fetch is cancelled, the fetch is cancelled too.
+        """
+        if self.cache_ttl > 0:
+            cached = self._cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+                return cached[1]
+        
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = self._inflight[key] = _Flight(asyncio.ensure_future(fetch()))
+            
+            def done(t: asyncio.Future) -> None:
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+                if t.cancelled() or t.exception() is not None:
+                    return
+                if self.cache_ttl > 0 and cacheable(t.result()):
+                    self._cache.pop(key, None)
+                    self._cache[key] = (time.monotonic(), t.result())
+                    while len(self._cache) > CACHE_MAX_ENTRIES:
+                        del self._cache[next(iter(self._cache))]
+            
+            flight.task.add_done_callback(done)
+        
+        # Shield so one caller's cancellation doesn't cancel the shared fetch;
+        # it is only cancelled once no caller is waiting for it any more
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+                flight.task.cancel()
+    
+    async def _send_with_retry(
+        self,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """
+        Send a request, retrying connection failures and 429/5xx responses.
+        
+        The last response or error is returned/raised once attempts run out.
+        Other status codes (including 400/401/402) are returned immediately.
+        """
+        for attempt in range(RETRY_ATTEMPTS - 1):
+            try:
+                response = await send()
+            except RETRY_EXCEPTIONS as e:
+                delay = _retry_delay(attempt)
+                logger.warning(f"Request failed ({e!r}), retrying in {delay:.2f}s")
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    return response
+                delay = _retry_delay(attempt, response)
+                logger.warning(
+                    f"Request returned {response.status_code}, retrying in {delay:.2f}s"
+                )
+            await asyncio.sleep(delay)
+        
+        return await send()
+    
     async def scrape(
         self,
         url: str,
         options: Optional[ScrapeOptions] = None,
+        use_cache: bool = True,
     ) -> ScrapeResult:
         """
         Scrape a URL synchronously.
         
+        Identical concurrent requests share one upstream call, and successful
+        results are cached in memory when FINEDATA_CACHE_TTL is set and on
+        disk when FINEDATA_CACHE_DIR is set. Requests that solve captchas or
+        use a sticky session are never shared or cached.
+        
         Args:
             url: Target URL to scrape
             options: Scraping options (use defaults if not provided)
+            use_cache: Set to False to always hit the API
             
         Returns:
             ScrapeResult with page content and metadata
@@ -144,14 +493,62 @@ class FineDataClient:
         if options is None:
             options = ScrapeOptions()
         
-        client = await self._get_client()
+        if not use_cache or options.solve_captcha or options.session_id:
+            return await self._scrape(url, options)
         
-        payload = {"url": url, **options.to_dict()}
+        canonical = orjson.dumps([url, dict(options.to_dict())], option=orjson.OPT_SORT_KEYS)
+        digest = hashlib.blake2b(canonical, digest_size=16).hexdigest()
+        return await self._coalesce(
+            "scrape:" + digest,
+            lambda: self._scrape_cached(url, options, digest),
+            lambda result: result.success,
+        )
+    
+    async def _scrape_cached(
+        self,
+        url: str,
+        options: ScrapeOptions,
+        digest: str,
+    ) -> ScrapeResult:
+        """Scrape through the persistent cache, if one is configured."""
+        if self._disk_cache is None:
+            return await self._scrape(url, options)
+        
+        entry = await asyncio.to_thread(self._disk_cache.load, digest, ScrapeResult)
+        if entry is None:
+            result = await self._scrape(url, options)
+        else:
+            cached, fresh = entry
+            if fresh:
+                return msgspec.structs.replace(cached, tokens_used=0, from_cache=True)
+            
+            # Stale: revalidate with a conditional request when possible
+            conditional = {}
+            if cached.etag:
+                conditional["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                conditional["If-Modified-Since"] = cached.last_modified
+            if conditional:
+                options = replace(options, headers={**options.headers, **conditional})
+            
+            result = await self._scrape(url, options)
+            if conditional and result.status_code == 304:
+                await asyncio.to_thread(self._disk_cache.touch, digest)
+                return msgspec.structs.replace(
+                    cached, tokens_used=result.tokens_used, from_cache=True
+                )
+        
+        if result.success:
+            await asyncio.to_thread(self._disk_cache.set, digest, result)
+        return result
+    
+    async def _scrape(self, url: str, options: ScrapeOptions) -> ScrapeResult:
+        """Perform the scrape request against the API."""
+        body = options.to_json(url)
         
         try:
-            response = await client.post(
-                f"{self.api_url}/api/v1/scrape",
-                json=payload,
+            response = await self._send_with_retry(
+                lambda: self._request("POST", "/api/v1/scrape", content=body)
             )
             
             if response.status_code == 401:
@@ -176,21 +573,38 @@ class FineDataClient:
                     error="Payment required. Please add tokens or upgrade your plan.",
                 )
             
-            data = response.json()
+            try:
+                envelope = _scrape_decoder.decode(response.content)
+            except msgspec.DecodeError:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    raise
+                # Still failing after retries, typically with a proxy error page
+                return ScrapeResult(
+                    success=False,
+                    status_code=response.status_code,
+                    headers={},
+                    body="",
+                    meta={},
+                    tokens_used=0,
+                    error=f"API returned HTTP {response.status_code} after {RETRY_ATTEMPTS} attempts",
+                )
+            return _to_scrape_result(envelope, status_code=response.status_code)
             
+        except CircuitOpenError:
             return ScrapeResult(
-                success=data.get("success", False),
-                status_code=data.get("status_code", response.status_code),
-                headers=data.get("headers", {}),
-                body=data.get("body", ""),
-                meta=data.get("meta", {}),
-                tokens_used=data.get("tokens_used", 0),
-                captcha_detected=data.get("captcha_detected", False),
-                captcha_type=data.get("captcha_type"),
-                captcha_solved=data.get("captcha_solved", False),
+                success=False,
+                status_code=503,
+                headers={},
+                body="",
+                meta={},
+                tokens_used=0,
+                error="upstream circuit open",
             )
-            
-        except httpx.TimeoutException:
+        except httpx.TimeoutException as e:
+            if isinstance(e, RETRY_EXCEPTIONS):
+                error = f"Could not connect to the API after {RETRY_ATTEMPTS} attempts"
+            else:
+                error = f"Request timed out after {self.timeout + 30} seconds"
             return ScrapeResult(
                 success=False,
                 status_code=504,
@@ -198,7 +612,21 @@ class FineDataClient:
                 body="",
                 meta={},
                 tokens_used=0,
-                error=f"Request timed out after {self.timeout} seconds",
+                error=error,
+            )
+        except httpx.TransportError as e:
+            if isinstance(e, RETRY_EXCEPTIONS):
+                error = f"Could not connect to the API after {RETRY_ATTEMPTS} attempts"
+            else:
+                error = f"Connection to the API failed: {e!r}"
+            return ScrapeResult(
+                success=False,
+                status_code=502,
+                headers={},
+                body="",
+                meta={},
+                tokens_used=0,
+                error=error,
             )
         except Exception as e:
             logger.error(f"Scrape request failed: {e}")
@@ -234,30 +662,20 @@ class FineDataClient:
         if options is None:
             options = ScrapeOptions()
         
-        client = await self._get_client()
-        
-        payload = {
-            "url": url,
-            **options.to_dict(),
-            "callback_url": callback_url,
-            "callback_headers": callback_headers,
-        }
+        body = options.to_json(
+            url,
+            callback_url=callback_url,
+            callback_headers=callback_headers,
+        )
         
         try:
-            response = await client.post(
-                f"{self.api_url}/api/v1/async/scrape",
-                json=payload,
+            response = await self._request(
+                "POST",
+                "/api/v1/async/scrape",
+                content=body,
             )
             response.raise_for_status()
-            data = response.json()
-            
-            return AsyncJob(
-                job_id=data["job_id"],
-                status=data["status"],
-                url=data["url"],
-                created_at=data["created_at"],
-                estimated_completion=data.get("estimated_completion"),
-            )
+            return _to_async_job(_job_decoder.decode(response.content))
             
         except Exception as e:
             logger.error(f"Async scrape request failed: {e}")
@@ -273,40 +691,69 @@ class FineDataClient:
         Returns:
             AsyncJob with current status and result if completed
         """
-        client = await self._get_client()
-        
         try:
-            response = await client.get(
-                f"{self.api_url}/api/v1/async/jobs/{job_id}",
+            response = await self._request(
+                "GET",
+                "/api/v1/async/jobs",
+                suffix=f"/{job_id}",
             )
             response.raise_for_status()
-            data = response.json()
-            
-            result = None
-            if data.get("result"):
-                r = data["result"]
-                result = ScrapeResult(
-                    success=r.get("success", False),
-                    status_code=r.get("status_code", 0),
-                    headers=r.get("headers", {}),
-                    body=r.get("body", ""),
-                    meta=r.get("meta", {}),
-                    tokens_used=data.get("tokens_used", 0),
-                )
-            
-            return AsyncJob(
-                job_id=data["job_id"],
-                status=data["status"],
-                url=data["url"],
-                created_at=data["created_at"],
-                result=result,
-                error=data.get("error"),
-            )
+            return _to_async_job(_job_decoder.decode(response.content))
             
         except Exception as e:
             logger.error(f"Get job status failed: {e}")
             raise
     
+    async def wait_for_job(
+        self,
+        job_id: str,
+        timeout: float = 300,
+        initial: float = 0.5,
+        cap: float = 10.0,
+    ) -> AsyncJob:
+        """
+        Poll an async job until it finishes or the timeout expires.
+        
+        The polling interval starts at `initial` seconds and grows by 1.5x
+        per poll up to `cap`, with a little jitter. Transient polling errors
+        (connection failures, 429/5xx, open circuit) are retried until the
+        deadline.
+        
+        Args:
+            job_id: Job ID from scrape_async
+            timeout: Maximum seconds to wait
+            initial: First polling interval in seconds
+            cap: Maximum polling interval in seconds
+            
+        Returns:
+            AsyncJob in a terminal status, or the latest status on timeout
+            
+        Raises:
+            The last polling error if the job status was never retrieved
+            before the deadline, or immediately for non-transient errors
+        """
+        deadline = time.monotonic() + timeout
+        job = None
+        n = 0
+        while True:
+            try:
+                job = await self.get_job_status(job_id)
+            except (CircuitOpenError, httpx.TransportError, httpx.HTTPStatusError) as e:
+                if (
+                    isinstance(e, httpx.HTTPStatusError)
+                    and e.response.status_code not in RETRY_STATUS_CODES
+                ) or (job is None and time.monotonic() >= deadline):
+                    raise
+                logger.warning(f"Polling job {job_id} failed ({e!r}), will retry")
+            
+            remaining = deadline - time.monotonic()
+            if job is not None and (job.status in TERMINAL_JOB_STATUSES or remaining <= 0):
+                return job
+            
+            delay = min(cap, initial * 1.5 ** n) + random.uniform(0, 0.2)
+            await asyncio.sleep(min(delay, remaining))
+            n += 1
+    
     async def batch_scrape(
         self,
         urls: list[str],
@@ -330,28 +777,82 @@ class FineDataClient:
         if len(urls) > 100:
             raise ValueError("Maximum 100 URLs per batch")
         
-        client = await self._get_client()
-        
-        # Build requests list
-        requests = [{"url": url, **options.to_dict()} for url in urls]
+        # Build requests list from the pre-encoded options
+        body = (
+            b'{"requests":['
+            + b",".join(options.to_json(url) for url in urls)
+            + b'],"callback_url":'
+            + orjson.dumps(callback_url)
+            + b"}"
+        )
         
-        payload = {
-            "requests": requests,
-            "callback_url": callback_url,
-        }
+        # Repeated per-URL options compress well; level 1 keeps CPU cost low
+        headers = {}
+        if self.gzip_requests and len(body) > GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
         
         try:
-            response = await client.post(
-                f"{self.api_url}/api/v1/async/batch",
-                json=payload,
+            response = await self._request(
+                "POST",
+                "/api/v1/async/batch",
+                content=body,
+                headers=headers,
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
             
         except Exception as e:
             logger.error(f"Batch scrape request failed: {e}")
             raise
     
+    async def scrape_as_completed(
+        self,
+        urls: list[str],
+        options: Optional[ScrapeOptions] = None,
+        concurrency: int = 20,
+    ) -> AsyncIterator[tuple[str, ScrapeResult | BaseException]]:
+        """
+        Scrape multiple URLs concurrently, yielding results as they finish.
+        
+        Unlike batch_scrape, this does not submit a server-side batch job;
+        each URL is scraped synchronously with at most `concurrency`
+        requests in flight, and each (url, result) pair is yielded as soon
+        as it is ready. Requests still pending when the iterator is closed
+        are cancelled.
+        
+        Args:
+            urls: List of URLs to scrape (max 100)
+            options: Scraping options (applied to all URLs)
+            concurrency: Maximum number of simultaneous requests
+            
+        Yields:
+            (url, result) in completion order; unexpected failures are
+            yielded as exception instances
+        """
+        if options is None:
+            options = ScrapeOptions()
+        
+        if len(urls) > 100:
+            raise ValueError("Maximum 100 URLs per batch")
+        
+        sem = asyncio.BoundedSemaphore(concurrency)
+        
+        async def one(url: str) -> tuple[str, ScrapeResult | BaseException]:
+            async with sem:
+                try:
+                    return url, await self.scrape(url, options)
+                except Exception as e:
+                    return url, e
+        
+        tasks = [asyncio.ensure_future(one(url)) for url in urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+    
     async def get_usage(self) -> dict[str, Any]:
         """
         Get current token usage for the API key.
@@ -359,25 +860,46 @@ class FineDataClient:
         Returns:
             Usage statistics including tokens used and limits
         """
-        client = await self._get_client()
-        
+        async with self._usage_lock:
+            if (
+                self._usage_cache is not None
+                and time.monotonic() - self._usage_cache[0] < USAGE_CACHE_TTL
+            ):
+                return self._usage_cache[1]
+            
+            usage = await self._get_usage()
+            self._usage_cache = (time.monotonic(), usage)
+            return usage
+    
+    async def _get_usage(self) -> dict[str, Any]:
+        """Fetch token usage from the API."""
         try:
-            response = await client.get(f"{self.api_url}/api/v1/usage")
+            response = await self._request("GET", "/api/v1/usage")
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
             
         except Exception as e:
             logger.error(f"Get usage failed: {e}")
             raise
 
 
-# Global client instance (lazy loaded)
-_client: Optional[FineDataClient] = None
+# Clients keyed by API key (lazy loaded), so each key keeps its own
+# connection pool instead of reconnecting when the key changes
+_clients: dict[str, FineDataClient] = {}
+
+
+def get_client(api_key: Optional[str] = None) -> FineDataClient:
+    """Get or create the client for an API key (default: the configured key)."""
+    if api_key is None:
+        api_key = get_config().api_key
+    client = _clients.get(api_key)
+    if client is None:
+        client = _clients[api_key] = FineDataClient(api_key)
+    return client
 
 
-def get_client() -> FineDataClient:
-    """Get or create the global client."""
-    global _client
-    if _client is None:
-        _client = FineDataClient()
-    return _client
+async def close_clients():
+    """Close all clients created by get_client."""
+    for client in _clients.values():
+        await client.close()
+    _clients.clear()
@@ -5,6 +5,11 @@ Environment variables:
 - FINEDATA_API_KEY: API key for authentication (required)
 - FINEDATA_API_URL: Base URL for FineData API (default: https://api.finedata.ai)
 - FINEDATA_TIMEOUT: Default timeout in seconds (default: 180)
+- FINEDATA_CACHE_TTL: Seconds to cache identical scrape results (default: 0, disabled)
+- FINEDATA_MAX_CONCURRENCY: Maximum simultaneous requests to the API (default: 50)
+- FINEDATA_CACHE_DIR: Directory for a persistent scrape cache (default: unset, disabled)
+- FINEDATA_CACHE_TTL_HOURS: Hours a persistent cache entry stays fresh (default: 24)
+- FINEDATA_GZIP_REQUESTS: Gzip-compress large batch request bodies (default: false)
 """
 
 import os
@@ -18,6 +23,11 @@ class Config:
     api_key: str
     api_url: str
     timeout: int
+    cache_ttl: float = 0.0
+    max_concurrency: int = 50
+    cache_dir: str | None = None
+    cache_ttl_hours: float = 24.0
+    gzip_requests: bool = False
     
     @classmethod
     def from_env(cls) -> "Config":
@@ -34,6 +44,11 @@ class Config:
             api_key=api_key,
             api_url=os.environ.get("FINEDATA_API_URL", "https://api.finedata.ai"),
             timeout=int(os.environ.get("FINEDATA_TIMEOUT", "180")),
+            cache_ttl=float(os.environ.get("FINEDATA_CACHE_TTL", "0")),
+            max_concurrency=int(os.environ.get("FINEDATA_MAX_CONCURRENCY", "50")),
+            cache_dir=os.environ.get("FINEDATA_CACHE_DIR") or None,
+            cache_ttl_hours=float(os.environ.get("FINEDATA_CACHE_TTL_HOURS", "24")),
+            gzip_requests=os.environ.get("FINEDATA_GZIP_REQUESTS", "").lower() in ("1", "true", "yes"),
         )
 
 
@@ -0,0 +1,67 @@
+"""
+Reliability primitives for the FineData API client.
+
+Provides a circuit breaker so calls fail fast while an endpoint is down
+instead of each one waiting for the full timeout.
+"""
+
+import time
+from enum import Enum
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for a single upstream endpoint.
+
+    After `threshold` consecutive failures the circuit opens and calls are
+    rejected. Once `reset_after` seconds have passed a single trial call is
+    let through (half-open): success closes the circuit, failure re-opens it.
+    """
+
+    def __init__(self, threshold: int = 5, reset_after: float = 30.0):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        self.last_open = 0.0
+
+    def before_call(self):
+        """Check that a call may proceed; raise CircuitOpenError if not."""
+        if self.state is CircuitState.CLOSED:
+            return
+
+        if (
+            self.state is CircuitState.OPEN
+            and time.monotonic() - self.last_open >= self.reset_after
+        ):
+            self.state = CircuitState.HALF_OPEN
+            return
+
+        raise CircuitOpenError("upstream circuit open")
+
+    def record_success(self):
+        """Record a successful call."""
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+
+    def record_failure(self):
+        """Record a failed call, opening the circuit if needed."""
+        self.failure_count += 1
+        if (
+            self.state is CircuitState.HALF_OPEN
+            or self.failure_count >= self.threshold
+        ):
+            self.state = CircuitState.OPEN
+            self.last_open = time.monotonic()
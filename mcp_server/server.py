@@ -9,12 +9,7 @@ import asyncio
 import logging
 import sys
 
-from mcp.server import Server
-from mcp.server.stdio import stdio_server
-from mcp.types import TextContent
-
-from .tools import TOOLS, call_tool
-from .client import get_client
+from .client import get_client, close_clients
 
 # Configure logging
 logging.basicConfig(
@@ -24,21 +19,38 @@ logging.basicConfig(
 )
 logger = logging.getLogger("finedata-mcp")
 
-# Create the MCP server instance
-server = Server("finedata")
-
-
-@server.list_tools()
-async def list_tools():
-    """Return list of available tools."""
-    return TOOLS
-
 
-@server.call_tool()
-async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
-    """Handle tool invocation."""
-    logger.info(f"Tool called: {name}")
-    return await call_tool(name, arguments or {})
+def _build_server():
+    """
+    Create the MCP server instance and register its handlers.
+    
+    The mcp package (and the tool definitions that depend on it) is only
+    imported here, so it isn't loaded until the server actually starts.
+    """
+    from mcp.server import Server
+    from mcp.types import TextContent
+    
+    from .tools import TOOLS, call_tool
+    
+    server = Server("finedata")
+    
+    @server.list_tools()
+    async def list_tools():
+        """Return list of available tools.
+        
+        TOOLS is built once at import and the same list is returned on every
+        call; serialization is left to the MCP runtime, which only accepts
+        typed Tool objects.
+        """
+        return TOOLS
+    
+    @server.call_tool()
+    async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
+        """Handle tool invocation."""
+        logger.info(f"Tool called: {name}")
+        return await call_tool(name, arguments or {})
+    
+    return server
 
 
 async def run_server():
@@ -55,16 +67,27 @@ async def run_server():
         logger.error(f"Configuration error: {e}")
         sys.exit(1)
     
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+    # Open the API connection in the background so neither the MCP
+    # handshake nor the first tool call waits for it. The reference keeps
+    # the task from being garbage-collected while it runs.
+    warmup = asyncio.create_task(get_client().warmup())
+    
+    from mcp.server.stdio import stdio_server
+    
+    server = _build_server()
+    
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+    finally:
+        warmup.cancel()
     
     # Cleanup
-    client = get_client()
-    await client.close()
+    await close_clients()
     logger.info("FineData MCP Server stopped")
 
 
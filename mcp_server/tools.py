@@ -4,10 +4,90 @@ MCP Tool definitions for FineData.
 Defines the tools that AI agents can use to interact with FineData API.
 """
 
+import asyncio
+import atexit
+import httpx
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
 from typing import Any
 from mcp.types import Tool, TextContent
 
-from .client import get_client, ScrapeOptions
+from .client import get_client, ScrapeOptions, ScrapeResult, RETRY_STATUS_CODES
+from .reliability import CircuitOpenError
+
+
+# Scraped pages larger than this are saved to a file instead of inlined
+LARGE_BODY_CHARS = 1024 * 1024
+
+# Bounds (and default) for get_job_status wait=true timeouts, in seconds
+JOB_WAIT_MIN = 1.0
+JOB_WAIT_MAX = 600.0
+JOB_WAIT_DEFAULT = 300.0
+
+# Saved pages are removed after BODY_FILE_RETENTION seconds
+BODY_FILE_RETENTION = 3600
+
+# Private directory for saved pages, created on first use
+_body_file_dir: Path | None = None
+_body_file_lock = threading.Lock()
+
+
+def _get_body_file_dir() -> Path:
+    """
+    Return this process's directory for saved pages, creating it if needed.
+    
+    The directory is made with mkdtemp (mode 0700, unique name) so other
+    local users can neither read the pages nor plant files in it. It is
+    removed when the process exits.
+    """
+    global _body_file_dir
+    with _body_file_lock:
+        if _body_file_dir is None:
+            _body_file_dir = Path(tempfile.mkdtemp(prefix="finedata-mcp-"))
+            atexit.register(shutil.rmtree, _body_file_dir, ignore_errors=True)
+        return _body_file_dir
+
+
+def _save_body(body: str) -> str:
+    """
+    Write a scraped page to a new private file and return its file:// URI.
+    
+    Files older than BODY_FILE_RETENTION are removed first.
+    """
+    directory = _get_body_file_dir()
+    
+    cutoff = time.time() - BODY_FILE_RETENTION
+    for old in directory.glob("*.html"):
+        try:
+            if old.stat().st_mtime < cutoff:
+                old.unlink()
+        except OSError:
+            pass  # Removed concurrently
+    
+    fd, path = tempfile.mkstemp(dir=directory, suffix=".html")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(body.encode("utf-8"))
+    except BaseException:
+        os.unlink(path)
+        raise
+    return Path(path).as_uri()
+
+
+async def _write_content(buf: io.StringIO, body: str):
+    """Append a page body to buf, saving it to a file if it is too large."""
+    if len(body) > LARGE_BODY_CHARS:
+        buf.write(f"\nContent size: {len(body)} characters")
+        uri = await asyncio.to_thread(_save_body, body)
+        buf.write(f"\nContent saved to: {uri}")
+    else:
+        buf.write("\n\n--- Content ---\n")
+        buf.write(body)
 
 
 # Tool definitions
@@ -35,7 +115,10 @@ Token costs:
 - JS rendering: +5 tokens  
 - Nodriver (max stealth): +6 tokens
 - Residential proxy: +3 tokens
-- Captcha solving: +10 tokens""",
+- Captcha solving: +10 tokens
+
+Pages larger than 1 MB are saved to a local file and its file:// path is
+returned instead of the inline content.""",
         inputSchema={
             "type": "object",
             "properties": {
@@ -94,6 +177,12 @@ Token costs:
                     "description": "TLS fingerprint profile. Options: 'chrome120', 'chrome124', 'firefox121', 'safari17', 'vip' (premium auto-rotation), 'vip:ios', 'vip:android', 'vip:windows', 'vip:mobile'. Default: chrome124",
                     "default": "chrome124",
                 },
+                "cache_control": {
+                    "type": "string",
+                    "enum": ["default", "no-cache"],
+                    "description": "Set to 'no-cache' to skip cached results and always fetch a fresh copy. Default: default",
+                    "default": "default",
+                },
             },
             "required": ["url"],
         },
@@ -160,7 +249,8 @@ Statuses:
 - failed: Error occurred
 - cancelled: Job was cancelled
 
-Poll this endpoint until status is 'completed' or 'failed'.""",
+Poll this endpoint until status is 'completed' or 'failed', or set
+wait=true to have the server poll and return once the job finishes.""",
         inputSchema={
             "type": "object",
             "properties": {
@@ -168,6 +258,18 @@ Poll this endpoint until status is 'completed' or 'failed'.""",
                     "type": "string",
                     "description": "Job ID returned from scrape_async",
                 },
+                "wait": {
+                    "type": "boolean",
+                    "description": "Wait until the job is completed, failed or cancelled before returning. Default: false",
+                    "default": False,
+                },
+                "timeout": {
+                    "type": "integer",
+                    "description": "Maximum seconds to wait when wait=true (1-600). Default: 300",
+                    "default": 300,
+                    "minimum": 1,
+                    "maximum": 600,
+                },
             },
             "required": ["job_id"],
         },
@@ -205,6 +307,11 @@ Returns a batch_id and list of job_ids for tracking.""",
                     "type": "string",
                     "description": "Webhook URL for batch completion",
                 },
+                "parallel": {
+                    "type": "boolean",
+                    "description": "Scrape URLs concurrently and return their content directly instead of submitting a batch job. Default: false",
+                    "default": False,
+                },
             },
             "required": ["urls"],
         },
@@ -245,34 +352,35 @@ async def handle_scrape_url(arguments: dict[str, Any]) -> list[TextContent]:
     )
     
     client = get_client()
-    result = await client.scrape(url, options)
+    result = await client.scrape(
+        url,
+        options,
+        use_cache=arguments.get("cache_control", "default") != "no-cache",
+    )
     
     if not result.success:
-        error_msg = result.error or f"Request failed with status {result.status_code}"
-        if result.meta.get("block_reason"):
-            error_msg += f" (block_reason: {result.meta['block_reason']})"
-        return [TextContent(type="text", text=f"Error: {error_msg}")]
-    
-    # Format response
-    response_parts = [
-        f"Successfully scraped {url}",
-        f"Status: {result.status_code}",
-        f"Tokens used: {result.tokens_used}",
-    ]
+        return [TextContent(type="text", text=f"Error: {_result_error(result)}")]
+    
+    # Format response; the body is written last without re-joining it
+    buf = io.StringIO()
+    buf.write(f"Successfully scraped {url}\n")
+    buf.write(f"Status: {result.status_code}\n")
+    buf.write(f"Tokens used: {result.tokens_used}")
     
     if result.captcha_detected:
-        response_parts.append(f"Captcha detected: {result.captcha_type}")
+        buf.write(f"\nCaptcha detected: {result.captcha_type}")
         if result.captcha_solved:
-            response_parts.append("Captcha solved: Yes")
+            buf.write("\nCaptcha solved: Yes")
     
     if result.meta.get("response_time_ms"):
-        response_parts.append(f"Response time: {result.meta['response_time_ms']}ms")
+        buf.write(f"\nResponse time: {result.meta['response_time_ms']}ms")
+    
+    if result.from_cache:
+        buf.write("\nServed from cache: Yes")
     
-    response_parts.append("")
-    response_parts.append("--- Content ---")
-    response_parts.append(result.body)
+    await _write_content(buf, result.body)
     
-    return [TextContent(type="text", text="\n".join(response_parts))]
+    return [TextContent(type="text", text=buf.getvalue())]
 
 
 async def handle_scrape_async(arguments: dict[str, Any]) -> list[TextContent]:
@@ -317,29 +425,34 @@ async def handle_get_job_status(arguments: dict[str, Any]) -> list[TextContent]:
         return [TextContent(type="text", text="Error: job_id is required")]
     
     client = get_client()
-    job = await client.get_job_status(job_id)
+    if arguments.get("wait", False):
+        try:
+            timeout = float(arguments.get("timeout", JOB_WAIT_DEFAULT))
+        except (TypeError, ValueError):
+            return [TextContent(type="text", text="Error: timeout must be a number of seconds")]
+        timeout = min(JOB_WAIT_MAX, max(JOB_WAIT_MIN, timeout))
+        job = await client.wait_for_job(job_id, timeout=timeout)
+    else:
+        job = await client.get_job_status(job_id)
     
-    response_parts = [
-        f"Job ID: {job.job_id}",
-        f"Status: {job.status}",
-        f"URL: {job.url}",
-        f"Created: {job.created_at}",
-    ]
+    buf = io.StringIO()
+    buf.write(f"Job ID: {job.job_id}\n")
+    buf.write(f"Status: {job.status}\n")
+    buf.write(f"URL: {job.url}\n")
+    buf.write(f"Created: {job.created_at}")
     
     if job.error:
-        response_parts.append(f"Error: {job.error}")
+        buf.write(f"\nError: {job.error}")
     
     if job.result:
-        response_parts.append("")
-        response_parts.append("--- Result ---")
-        response_parts.append(f"Success: {job.result.success}")
-        response_parts.append(f"Status code: {job.result.status_code}")
-        response_parts.append(f"Tokens used: {job.result.tokens_used}")
-        response_parts.append("")
-        response_parts.append("--- Content ---")
-        response_parts.append(job.result.body)
+        buf.write("\n\n--- Result ---\n")
+        buf.write(f"Success: {job.result.success}\n")
+        buf.write(f"Status code: {job.result.status_code}\n")
+        buf.write(f"Tokens used: {job.result.tokens_used}\n")
+        buf.write("\n--- Content ---\n")
+        buf.write(job.result.body)
     
-    return [TextContent(type="text", text="\n".join(response_parts))]
+    return [TextContent(type="text", text=buf.getvalue())]
 
 
 async def handle_batch_scrape(arguments: dict[str, Any]) -> list[TextContent]:
@@ -358,6 +471,29 @@ async def handle_batch_scrape(arguments: dict[str, Any]) -> list[TextContent]:
     )
     
     client = get_client()
+    
+    if arguments.get("parallel", False):
+        # One entry per URL, in the order the scrapes finish
+        contents = []
+        async for url, result in client.scrape_as_completed(urls, options):
+            if isinstance(result, BaseException):
+                retryable = "true" if _is_retryable(result) else "false"
+                text = f"{url}\nError: {result} (retryable: {retryable})"
+            elif not result.success:
+                text = f"{url}\nError: {_result_error(result)}"
+            else:
+                buf = io.StringIO()
+                buf.write(f"{url}\n")
+                buf.write(f"Status: {result.status_code}\n")
+                buf.write(f"Tokens used: {result.tokens_used}")
+                if result.from_cache:
+                    buf.write("\nServed from cache: Yes")
+                await _write_content(buf, result.body)
+                text = buf.getvalue()
+            contents.append(TextContent(type="text", text=text))
+        
+        return contents
+    
     result = await client.batch_scrape(
         urls,
         options,
@@ -400,14 +536,27 @@ For detailed billing, visit https://finedata.ai/billing"""
     return [TextContent(type="text", text=response)]
 
 
-# Tool handler mapping
-TOOL_HANDLERS = {
-    "scrape_url": handle_scrape_url,
-    "scrape_async": handle_scrape_async,
-    "get_job_status": handle_get_job_status,
-    "batch_scrape": handle_batch_scrape,
-    "get_usage": handle_get_usage,
-}
+def _result_error(result: ScrapeResult) -> str:
+    """
+    Describe a failed scrape, marked with whether retrying may help.
+    
+    The client reports circuit-open (503), timeout (504), connection (502)
+    and rate-limit (429) failures as results rather than exceptions.
+    """
+    error_msg = result.error or f"Request failed with status {result.status_code}"
+    if result.meta.get("block_reason"):
+        error_msg += f" (block_reason: {result.meta['block_reason']})"
+    retryable = "true" if result.status_code in RETRY_STATUS_CODES else "false"
+    return f"{error_msg} (retryable: {retryable})"
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Whether a failed tool call may succeed if the agent retries it."""
+    if isinstance(error, CircuitOpenError):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRY_STATUS_CODES
+    return isinstance(error, httpx.TransportError)
 
 
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
@@ -419,13 +568,25 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         arguments: Tool arguments
         
     Returns:
-        List of TextContent with the result
+        List of TextContent with the result. Errors from the API are
+        marked with whether retrying the call may help.
     """
-    handler = TOOL_HANDLERS.get(name)
-    if not handler:
-        return [TextContent(type="text", text=f"Error: Unknown tool '{name}'")]
-    
     try:
-        return await handler(arguments)
+        match name:
+            case "scrape_url":
+                return await handle_scrape_url(arguments)
+            case "scrape_async":
+                return await handle_scrape_async(arguments)
+            case "get_job_status":
+                return await handle_get_job_status(arguments)
+            case "batch_scrape":
+                return await handle_batch_scrape(arguments)
+            case "get_usage":
+                return await handle_get_usage(arguments)
+            case _:
+                return [TextContent(type="text", text=f"Error: Unknown tool '{name}'")]
+    except (httpx.HTTPError, CircuitOpenError) as e:
+        retryable = "true" if _is_retryable(e) else "false"
+        return [TextContent(type="text", text=f"Error: {e} (retryable: {retryable})")]
     except Exception as e:
         return [TextContent(type="text", text=f"Error: {str(e)}")]
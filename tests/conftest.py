@@ -0,0 +1,33 @@
+"""Shared fixtures for the FineData MCP tests."""
+
+from typing import Callable
+
+import httpx
+import pytest
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    """
+    Factory for FineDataClient instances backed by an httpx.MockTransport.
+
+    Keyword arguments are set as FINEDATA_* environment variables (e.g.
+    cache_ttl=60 sets FINEDATA_CACHE_TTL) before the config is loaded.
+    """
+    from mcp_server import config
+    from mcp_server.client import FineDataClient
+
+    def factory(
+        handler: Callable[[httpx.Request], httpx.Response],
+        **env: object,
+    ) -> FineDataClient:
+        monkeypatch.setenv("FINEDATA_API_KEY", "fd_test")
+        for name, value in env.items():
+            monkeypatch.setenv(f"FINEDATA_{name.upper()}", str(value))
+        monkeypatch.setattr(config, "_config", None)
+
+        client = FineDataClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    return factory
@@ -0,0 +1,385 @@
+"""Tests for FineDataClient request options and response decoding."""
+
+import asyncio
+import copy
+import dataclasses
+import pickle
+import time
+import types
+
+import httpx
+import orjson
+import pytest
+
+from mcp_server.client import (
+    ScrapeOptions,
+    _job_decoder,
+    _scrape_decoder,
+    _to_async_job,
+    _to_scrape_result,
+)
+
+
+def test_options_survive_copy_and_pickle():
+    options = ScrapeOptions(use_js_render=True, headers={"Accept": "text/html"})
+    for clone in (copy.copy(options), copy.deepcopy(options), pickle.loads(pickle.dumps(options))):
+        assert clone == options
+        assert clone.to_dict() == options.to_dict()
+        assert clone.to_json("https://example.com") == options.to_json("https://example.com")
+    assert dataclasses.asdict(options)["use_js_render"] is True
+
+
+def test_options_to_dict_is_read_only():
+    with pytest.raises(TypeError):
+        ScrapeOptions().to_dict()["timeout"] = 1
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        ScrapeOptions(),
+        ScrapeOptions(use_js_render=True, session_id="s1", headers={"Accept": "text/html"}),
+        ScrapeOptions(method="POST", body='{"q": "\u00e9"}', tls_profile="vip:ios"),
+    ],
+)
+def test_to_json_matches_full_encoding(options):
+    url = 'https://example.com/?q="quoted"&x=\u00e9'
+    assert options.to_json(url) == orjson.dumps({"url": url, **options.to_dict()})
+    assert options.to_json(url, callback_url=None, priority=2) == orjson.dumps(
+        {"url": url, **options.to_dict(), "callback_url": None, "priority": 2}
+    )
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b'{"success": true, "body": null}',
+        b'{"success": true, "headers": null}',
+        b'{"success": true, "meta": null}',
+        b'{"success": true, "tokens_used": null}',
+    ],
+)
+def test_null_fields_use_defaults(payload):
+    result = _to_scrape_result(_scrape_decoder.decode(payload), status_code=200)
+    assert result.success
+    assert result.status_code == 200
+    assert result.body == ""
+    assert result.headers == {}
+    assert result.meta == {}
+    assert result.tokens_used == 0
+
+
+def test_fractional_tokens_are_kept():
+    result = _to_scrape_result(_scrape_decoder.decode(b'{"tokens_used": 1.5}'))
+    assert result.tokens_used == 1.5
+
+
+def test_api_error_message_is_kept():
+    payload = b'{"success": false, "status_code": 403, "error": "blocked by target"}'
+    result = _to_scrape_result(_scrape_decoder.decode(payload), status_code=200)
+    assert not result.success
+    assert result.status_code == 403
+    assert result.error == "blocked by target"
+
+
+def test_page_validators_are_extracted():
+    payload = b'{"headers": {"ETag": "\\"abc\\"", "last-modified": "Mon"}}'
+    result = _to_scrape_result(_scrape_decoder.decode(payload))
+    assert result.etag == '"abc"'
+    assert result.last_modified == "Mon"
+
+
+def test_job_with_null_tokens():
+    payload = (
+        b'{"job_id": "j", "status": "completed", "url": "https://example.com",'
+        b' "created_at": "now", "tokens_used": null, "result": {"body": "x"}}'
+    )
+    job = _to_async_job(_job_decoder.decode(payload))
+    assert job.result is not None
+    assert job.result.body == "x"
+    assert job.result.tokens_used == 0
+
+
+def test_job_tokens_are_reported_on_result():
+    payload = (
+        b'{"job_id": "j", "status": "completed", "url": "https://example.com",'
+        b' "created_at": "now", "tokens_used": 3, "result": {"body": "x"}}'
+    )
+    job = _to_async_job(_job_decoder.decode(payload))
+    assert job.result.tokens_used == 3
+
+
+def test_cancelling_as_completed_cancels_pending_scrapes(make_client):
+    started, finished = [], []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        started.append(request)
+        await asyncio.sleep(5)
+        finished.append(request)
+        return httpx.Response(200, content=b'{"success": true}')
+    
+    async def main():
+        client = make_client(handler)
+        urls = [f"https://example.com/{i}" for i in range(5)]
+        
+        async def consume():
+            async for _ in client.scrape_as_completed(urls):
+                pass
+        
+        task = asyncio.ensure_future(consume())
+        while len(started) < len(urls):
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.05)
+        
+        assert finished == []
+        assert client._inflight == {}
+    
+    asyncio.run(main())
+
+
+def test_shared_fetch_survives_one_cancelled_waiter(make_client):
+    calls = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, content=b'{"success": true, "body": "page"}')
+    
+    async def main():
+        client = make_client(handler)
+        first = asyncio.ensure_future(client.scrape("https://example.com"))
+        second = asyncio.ensure_future(client.scrape("https://example.com"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        result = await second
+        assert result.body == "page"
+        assert len(calls) == 1
+    
+    asyncio.run(main())
+
+
+def test_wait_for_job_keeps_polling_through_transient_errors(make_client):
+    def job(status: str) -> httpx.Response:
+        return httpx.Response(200, content=orjson.dumps({
+            "job_id": "j1",
+            "status": status,
+            "url": "https://example.com",
+            "created_at": "now",
+        }))
+    
+    responses = iter([
+        httpx.Response(503),
+        httpx.ConnectError("refused"),
+        job("processing"),
+        httpx.Response(502),
+        job("completed"),
+    ])
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+    
+    client = make_client(handler)
+    result = asyncio.run(client.wait_for_job("j1", timeout=5, initial=0.001, cap=0.001))
+    assert result.status == "completed"
+
+
+def test_wait_for_job_raises_non_transient_errors(make_client):
+    client = make_client(lambda request: httpx.Response(404))
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.wait_for_job("missing", timeout=5, initial=0.001))
+
+
+def scrape_response(body: str = "page", **fields) -> httpx.Response:
+    return httpx.Response(200, content=orjson.dumps({
+        "success": True, "status_code": 200, "body": body, "tokens_used": 1, **fields,
+    }))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for the client module only."""
+    from mcp_server import client
+    now = [1000.0]
+    monkeypatch.setattr(
+        client, "time", types.SimpleNamespace(monotonic=lambda: now[0], time=time.time)
+    )
+    return now
+
+
+def test_concurrent_identical_scrapes_share_one_request(make_client):
+    calls = []
+    
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return scrape_response()
+    
+    async def main():
+        client = make_client(handler)
+        return await asyncio.gather(*(client.scrape("https://example.com") for _ in range(3)))
+    
+    results = asyncio.run(main())
+    assert [result.body for result in results] == ["page"] * 3
+    assert len(calls) == 1
+
+
+def test_cached_results_expire_after_ttl(make_client, clock):
+    calls = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return scrape_response()
+    
+    async def main():
+        client = make_client(handler, cache_ttl=60)
+        await client.scrape("https://example.com")
+        clock[0] += 59
+        await client.scrape("https://example.com")
+        assert len(calls) == 1
+        
+        clock[0] += 1
+        await client.scrape("https://example.com")
+        assert len(calls) == 2
+    
+    asyncio.run(main())
+
+
+def test_failed_results_are_not_cached(make_client):
+    calls = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, content=b'{"success": false, "error": "blocked"}')
+    
+    async def main():
+        client = make_client(handler, cache_ttl=60)
+        await client.scrape("https://example.com")
+        await client.scrape("https://example.com")
+    
+    asyncio.run(main())
+    assert len(calls) == 2
+
+
+def test_cache_evicts_oldest_entries(make_client, monkeypatch):
+    from mcp_server import client as client_module
+    monkeypatch.setattr(client_module, "CACHE_MAX_ENTRIES", 2)
+    calls = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(orjson.loads(request.content)["url"])
+        return scrape_response()
+    
+    async def main():
+        client = make_client(handler, cache_ttl=60)
+        for path in ("a", "b", "c", "b", "c", "a"):
+            await client.scrape(f"https://example.com/{path}")
+        assert len(client._cache) == 2
+    
+    asyncio.run(main())
+    assert calls == [f"https://example.com/{path}" for path in ("a", "b", "c", "a")]
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry delays instead of sleeping."""
+    from mcp_server import client
+    delays = []
+    
+    async def sleep(delay):
+        delays.append(delay)
+    
+    monkeypatch.setattr(client.asyncio, "sleep", sleep)
+    return delays
+
+
+def test_retries_429_with_capped_retry_after(make_client, sleeps):
+    responses = iter([
+        httpx.Response(429, headers={"Retry-After": "3600"}),
+        scrape_response(),
+    ])
+    client = make_client(lambda request: next(responses))
+    
+    result = asyncio.run(client.scrape("https://example.com", use_cache=False))
+    assert result.success
+    assert sleeps == [30.0]
+
+
+def test_retries_connection_errors(make_client, sleeps):
+    calls = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused")
+        return scrape_response()
+    
+    client = make_client(handler)
+    result = asyncio.run(client.scrape("https://example.com", use_cache=False))
+    assert result.success
+    assert len(calls) == 2
+
+
+def test_read_timeouts_are_not_retried(make_client, sleeps):
+    calls = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        raise httpx.ReadTimeout("slow")
+    
+    client = make_client(handler)
+    result = asyncio.run(client.scrape("https://example.com", use_cache=False))
+    assert result.status_code == 504
+    assert result.error.startswith("Request timed out")
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_fresh_disk_cache_entry_skips_the_api(make_client, tmp_path):
+    calls = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return scrape_response()
+    
+    async def main():
+        client = make_client(handler, cache_dir=tmp_path)
+        await client.scrape("https://example.com")
+        return await client.scrape("https://example.com")
+    
+    result = asyncio.run(main())
+    assert len(calls) == 1
+    assert result.from_cache
+    assert result.tokens_used == 0
+
+
+def test_stale_disk_cache_entry_is_revalidated(make_client, tmp_path):
+    requests = []
+    responses = iter([
+        scrape_response(headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+        httpx.Response(200, content=b'{"success": false, "status_code": 304, "tokens_used": 1}'),
+    ])
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(orjson.loads(request.content))
+        return next(responses)
+    
+    async def main():
+        client = make_client(handler, cache_dir=tmp_path, cache_ttl_hours=0)
+        await client.scrape("https://example.com")
+        return await client.scrape("https://example.com")
+    
+    result = asyncio.run(main())
+    assert requests[1]["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+    assert result.success
+    assert result.body == "page"
+    assert result.from_cache
+    assert result.tokens_used == 1
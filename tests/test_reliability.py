@@ -0,0 +1,124 @@
+"""Tests for the circuit breaker and its use in FineDataClient."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from mcp_server import reliability
+from mcp_server.reliability import CircuitBreaker, CircuitOpenError, CircuitState
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic in the reliability module."""
+    now = [1000.0]
+    monkeypatch.setattr(reliability.time, "monotonic", lambda: now[0])
+    return now
+
+
+def trip(breaker: CircuitBreaker):
+    for _ in range(breaker.threshold):
+        breaker.before_call()
+        breaker.record_failure()
+
+
+def test_opens_after_threshold_failures(clock):
+    breaker = CircuitBreaker(threshold=3, reset_after=30)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(threshold=2, reset_after=30)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_allows_single_trial(clock):
+    breaker = CircuitBreaker(threshold=2, reset_after=30)
+    trip(breaker)
+    
+    clock[0] += 29
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    
+    clock[0] += 1
+    breaker.before_call()
+    assert breaker.state is CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_half_open_success_closes(clock):
+    breaker = CircuitBreaker(threshold=2, reset_after=30)
+    trip(breaker)
+    clock[0] += 30
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.failure_count == 0
+    breaker.before_call()
+
+
+def test_half_open_failure_reopens(clock):
+    breaker = CircuitBreaker(threshold=2, reset_after=30)
+    trip(breaker)
+    clock[0] += 30
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.last_open == clock[0]
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_client_recovers_after_failed_half_open_trial(clock, monkeypatch):
+    """A trial call failing with a non-transport error must not wedge the circuit."""
+    monkeypatch.setenv("FINEDATA_API_KEY", "fd_test")
+    from mcp_server import config
+    monkeypatch.setattr(config, "_config", None)
+    from mcp_server.client import FineDataClient
+    
+    statuses = iter([500] * 5 + ["bad gzip", 200])
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = next(statuses)
+        if status == "bad gzip":
+            return httpx.Response(
+                200,
+                stream=httpx.ByteStream(b"not gzip"),
+                headers={"Content-Encoding": "gzip"},
+            )
+        return httpx.Response(status)
+    
+    async def main():
+        client = FineDataClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        for _ in range(5):
+            response = await client._request("GET", "/api/v1/usage")
+            assert response.status_code == 500
+        breaker = client._breakers["/api/v1/usage"]
+        assert breaker.state is CircuitState.OPEN
+        
+        clock[0] += breaker.reset_after
+        with pytest.raises(httpx.DecodingError):
+            await client._request("GET", "/api/v1/usage")
+        assert breaker.state is CircuitState.OPEN
+        
+        clock[0] += breaker.reset_after
+        response = await client._request("GET", "/api/v1/usage")
+        assert response.status_code == 200
+        assert breaker.state is CircuitState.CLOSED
+    
+    asyncio.run(main())
@@ -0,0 +1,128 @@
+"""Tests for the MCP tool handlers."""
+
+import asyncio
+import os
+import stat
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+import httpx
+import orjson
+import pytest
+
+from mcp_server import tools
+from mcp_server.reliability import CircuitBreaker, CircuitState
+
+
+@pytest.fixture
+def body_dir(monkeypatch):
+    """Give each test a fresh saved-page directory."""
+    monkeypatch.setattr(tools, "_body_file_dir", None)
+
+
+def uri_path(uri: str) -> Path:
+    return Path(url2pathname(urlparse(uri).path))
+
+
+def test_save_body_uses_private_directory(body_dir):
+    path = uri_path(tools._save_body("<html>page</html>"))
+    assert path.read_text() == "<html>page</html>"
+
+    directory = path.parent
+    assert directory.name.startswith("finedata-mcp-")
+    if os.name == "posix":
+        assert stat.S_IMODE(directory.stat().st_mode) == 0o700
+        assert directory.stat().st_uid == os.getuid()
+
+
+def test_save_body_never_reuses_existing_files(body_dir):
+    first = uri_path(tools._save_body("same"))
+    first.write_text("tampered")
+    second = uri_path(tools._save_body("same"))
+    assert second != first
+    assert second.read_text() == "same"
+
+
+def test_parallel_batch_saves_large_pages(body_dir, make_client, monkeypatch):
+    large = "x" * (tools.LARGE_BODY_CHARS + 1)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = orjson.loads(request.content)["url"]
+        body = large if url.endswith("large") else "small page"
+        return httpx.Response(
+            200,
+            content=orjson.dumps({"success": True, "status_code": 200, "body": body}),
+        )
+
+    client = make_client(handler)
+    monkeypatch.setattr(tools, "get_client", lambda: client)
+
+    contents = asyncio.run(tools.handle_batch_scrape({
+        "urls": ["https://example.com/large", "https://example.com/small"],
+        "parallel": True,
+    }))
+    texts = {content.text.split("\n", 1)[0]: content.text for content in contents}
+
+    assert large not in texts["https://example.com/large"]
+    assert "Content saved to: file://" in texts["https://example.com/large"]
+    assert "--- Content ---\nsmall page" in texts["https://example.com/small"]
+
+
+def test_scrape_url_marks_circuit_open_as_retryable(make_client, monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("no request expected while the circuit is open")
+    
+    client = make_client(handler)
+    breaker = client._breakers["/api/v1/scrape"] = CircuitBreaker()
+    breaker.state = CircuitState.OPEN
+    breaker.last_open = time.monotonic()
+    monkeypatch.setattr(tools, "get_client", lambda: client)
+    
+    [content] = asyncio.run(tools.handle_scrape_url({"url": "https://example.com"}))
+    assert content.text == "Error: upstream circuit open (retryable: true)"
+
+
+@pytest.mark.parametrize(
+    ("response", "retryable"),
+    [
+        (httpx.Response(200, content=b'{"success": false, "status_code": 403, "error": "blocked"}'), "false"),
+        (httpx.Response(502, content=b"<html>Bad Gateway</html>"), "true"),
+        (httpx.Response(429, content=b'{"success": false, "error": "slow down"}'), "true"),
+    ],
+)
+def test_parallel_batch_marks_failures(make_client, monkeypatch, response, retryable):
+    client = make_client(lambda request: response)
+    monkeypatch.setattr(tools, "get_client", lambda: client)
+    monkeypatch.setattr("mcp_server.client.RETRY_BACKOFF_CAP", 0.0)
+    
+    [content] = asyncio.run(tools.handle_batch_scrape({
+        "urls": ["https://example.com"],
+        "parallel": True,
+    }))
+    assert content.text.endswith(f"(retryable: {retryable})")
+
+
+@pytest.mark.parametrize(
+    ("timeout", "expected"),
+    [(100000, 600.0), (0, 1.0), ("30", 30.0), (None, None)],
+)
+def test_get_job_status_bounds_wait_timeout(monkeypatch, timeout, expected):
+    waited = []
+    
+    class Client:
+        async def wait_for_job(self, job_id, timeout):
+            waited.append(timeout)
+            raise RuntimeError("stop")
+    
+    monkeypatch.setattr(tools, "get_client", Client)
+    
+    [content] = asyncio.run(tools.call_tool(
+        "get_job_status", {"job_id": "j1", "wait": True, "timeout": timeout}
+    ))
+    if expected is None:
+        assert waited == []
+        assert "timeout must be a number" in content.text
+    else:
+        assert waited == [expected]